@@ -21,10 +21,11 @@ else
 fi
 
 # Download Amy voice model (pleasant female voice)
-if [ ! -f "en_US-amy-medium.onnx" ]; then
+# The low quality voice synthesizes about twice as fast as medium, so replies start sooner
+if [ ! -f "en_US-amy-low.onnx" ]; then
     echo "Downloading Amy voice model..."
-    wget -q https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/amy/medium/en_US-amy-medium.onnx
-    wget -q https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/amy/medium/en_US-amy-medium.onnx.json
+    wget -q https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/amy/low/en_US-amy-low.onnx
+    wget -q https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/amy/low/en_US-amy-low.onnx.json
     echo "✓ Voice model installed"
 else
     echo "✓ Voice model already installed"
@@ -32,7 +33,7 @@ fi
 
 # Test Piper
 echo "Testing Piper..."
-echo "Hello! This is your new natural voice assistant." | ./piper/piper --model en_US-amy-medium.onnx --output_file test.wav
+echo "Hello! This is your new natural voice assistant." | ./piper/piper --model en_US-amy-low.onnx --output_file test.wav
 if [ -f "test.wav" ]; then
     aplay test.wav 2>/dev/null
     rm test.wav
@@ -49,5 +50,7 @@ echo "Alternative voices you can try:"
 echo "- en_US-lessac-medium: Professional male voice"
 echo "- en_US-libritts_r-medium: Clear female voice"
 echo "- en_GB-jenny_dioco-medium: British female voice"
+echo "- en_US-amy-medium: Smoother version of the default voice (slower)"
 echo ""
-echo "To change voices, download a different model and update voice_assistant.py"
\ No newline at end of file
+echo "To change voices, download a different model (with its .onnx.json) and set"
+echo "ZIGGY_PIPER_MODEL to its path, or add it to piper_voices in voice_assistant.py"
\ No newline at end of file
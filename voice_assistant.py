@@ -18,25 +18,58 @@ Dependencies: vosk, pyaudio, requests
 """
 
 import json
+import math
 import os
 import re
+import shutil
 import subprocess
 import time
 import tempfile
 import signal
+import statistics
 import sys
 import threading
 import queue
 import urllib.parse
+import webbrowser
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 import psutil  # For memory detection
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import vosk
 import pyaudio
 import wave
 
+try:
+    import numpy as np  # Optional: faster audio level measurement
+except ImportError:
+    np = None
+
+try:
+    import orjson  # Optional: faster parsing of recognizer results and backend responses
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from faster_whisper import WhisperModel  # Optional: more accurate command transcription
+except ImportError:
+    WhisperModel = None
+
+try:
+    import webrtcvad  # Optional: cheap speech/silence detection while recording
+except ImportError:
+    webrtcvad = None
+
 # Resource profile definitions
 RESOURCE_PROFILES = {
     "minimal": {
@@ -71,6 +104,159 @@ RESOURCE_PROFILES = {
     }
 }
 
+# System prompts are built once; only the history window changes between turns
+LOCAL_ONLY_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a local AI assistant. Answer questions using only your training data. If a question requires current information, real-time data, or internet searches, respond with exactly: 'I need online resources to answer that properly.'"
+}
+CONVERSATION_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are having a friendly conversation. Respond naturally and keep the conversation flowing. Feel free to ask follow-up questions or share related thoughts. Be engaging and personable."
+}
+
+# Personal details worth remembering after the turn that mentioned them is trimmed
+MEMORY_FACT_RE = re.compile(
+    r"\b(my name is|call me|i live in|i am from|i'm from|i work (?:at|as|for)|"
+    r"i like|i love|i prefer|i don't like|remind me (?:to|about))\s+"
+    r"((?:(?!\s(?:and|but|so)\s)[^.,!?]){1,60})",
+    re.IGNORECASE
+)
+
+# Patterns used on every spoken response
+SENTENCE_END_RE = re.compile(r'[.!?]+(?=\s)')
+NUMBER_RE = re.compile(r'-?\d+\.?\d*')
+WHITESPACE_RE = re.compile(r'\s+')
+QUESTION_START_RE = re.compile(
+    r'(?:^|\.)\s*(?:what|where|when|who|why|how|would|could|should|can|will|do|'
+    r'does|did|is|are|was|were|have|has|had|may|might) ',
+    re.IGNORECASE
+)
+
+# Keyword sets matched in a single scan each (whole words for spoken yes/no answers)
+NEW_CONVERSATION_RE = re.compile(r'new conversation|start over|clear history|fresh start')
+AFFIRMATIVE_RE = re.compile(r"\b(?:yes|yeah|yep|okay|ok|sure|go ahead|please)\b")
+NEGATIVE_RE = re.compile(r"\b(?:no|nope|don't|stop|cancel|nevermind)\b")
+READ_CHOICE_RE = re.compile(r'\b(?:read|tell|say|speak|answer)\b')
+BROWSE_CHOICE_RE = re.compile(r'\b(?:browser|open|window|firefox|chrome)\b')
+KEEP_RUNNING_RE = re.compile(r'\b(?:yes|yeah|yep|keep|leave)\b')
+
+# Single-word triggers for local functions, matched against the query's word set
+TIME_WORDS = frozenset(['time', 'clock'])
+DATE_WORDS = frozenset(['date', 'today'])
+CONVERSION_WORDS = frozenset(['convert', 'celsius', 'fahrenheit', 'meters', 'feet', 'pounds', 'kilograms'])
+
+# Profile management commands - support various phrasings; the greedy prefix
+# picks the trigger closest to "mode"/"profile", so the profile name is group 1
+PROFILE_SWITCH_RE = re.compile(
+    r'^.*\b(?:switch(?:ed)? to|change to|use|set|enable)\b(.*?)\b(?:mode|profile)\b'
+)
+PROFILE_STATUS_RE = re.compile(r'\b(?:what|which|current) profile\b')
+PROFILE_LIST_RE = re.compile(r'what profiles|available profiles|list profiles')
+
+
+@lru_cache(maxsize=256)
+def classify_query(text_lower, shutdown_phrase, conversions=True):
+    """Decide how to handle a normalized query, returning (route, argument)"""
+    # Check for shutdown command
+    if shutdown_phrase in text_lower:
+        return "shutdown", None
+
+    # Check for new conversation command
+    if NEW_CONVERSATION_RE.search(text_lower):
+        return "new_conversation", None
+
+    match = PROFILE_SWITCH_RE.search(text_lower)
+    if match:
+        return "switch_profile", match.group(1).strip()
+
+    if PROFILE_STATUS_RE.search(text_lower):
+        return "current_profile", None
+
+    if PROFILE_LIST_RE.search(text_lower):
+        return "list_profiles", None
+
+    if 'memory' in text_lower and ('using' in text_lower or 'usage' in text_lower or 'status' in text_lower):
+        return "memory", None
+
+    # Whole words only, so "sometimes" or "update" don't trigger time/date
+    words = set(text_lower.replace('?', ' ').replace('.', ' ').split())
+
+    # Time queries
+    if not words.isdisjoint(TIME_WORDS):
+        return "time", None
+
+    # Date queries
+    if not words.isdisjoint(DATE_WORDS) or 'what day' in text_lower:
+        return "date", None
+
+    # Unit conversions
+    if conversions and not words.isdisjoint(CONVERSION_WORDS):
+        return "conversion", None
+
+    # Web search
+    if text_lower.startswith('search') or 'look up' in text_lower:
+        return "search", text_lower.replace('search', '').replace('look up', '').strip()
+
+    # Send to AI for complex queries
+    return "ai", None
+
+
+def frame_energy(data):
+    """Sum of squared samples of a chunk of 16-bit mono PCM"""
+    if np is not None:
+        samples = np.frombuffer(data, dtype=np.int16).astype(np.int64)
+        return int(samples @ samples)
+    return sum(s * s for s in array('h', data))
+
+
+def frame_rms(data):
+    """Root-mean-square level of a chunk of 16-bit mono PCM"""
+    if np is not None:
+        samples = np.frombuffer(data, dtype=np.int16).astype(np.float32)
+        return float(np.sqrt(np.mean(samples * samples))) if samples.size else 0.0
+    samples = array('h', data)
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+class StreamedResponse:
+    """AI response that is spoken sentence by sentence while the backend is still generating"""
+
+    def __init__(self, sentences, on_complete=None):
+        self.sentences = sentences
+        self.on_complete = on_complete
+        self.spoken = []
+        self.first = None
+        self.closed = False
+
+    def peek(self):
+        """Wait for the first sentence without consuming it"""
+        if self.first is None:
+            self.first = next(self.sentences, None)
+        return self.first
+
+    def __iter__(self):
+        if self.first is not None:
+            yield self.first
+        yield from self.sentences
+
+    def mark_spoken(self, sentence):
+        """Record a sentence once the speaker has actually played it"""
+        self.spoken.append(sentence)
+
+    def close(self):
+        """Stop generation and hand the text spoken so far to on_complete"""
+        if self.closed:
+            return
+        self.closed = True
+        self.sentences.close()
+        if self.on_complete:
+            self.on_complete(str(self))
+
+    def __str__(self):
+        return ' '.join(self.spoken)
+
 
 class VoiceAssistant:
     def __init__(self):
@@ -80,7 +266,13 @@ class VoiceAssistant:
         self.is_listening = True
         self.is_processing = False
         self.conversational_mode = False  # Track if we're in a conversation
-        self.conversation_history = []  # Store conversation context
+        self.conversation_history = deque()  # Store conversation context (bounded by profile)
+        self.history_tokens = deque()  # Estimated tokens of each history message, in step with it
+        # Old exchanges are dropped this many at a time, so the prompt prefix stays
+        # the same for several turns and the backend can reuse its KV cache
+        self.history_trim_batch = 4
+        # Facts pulled from trimmed exchanges, kept in the system prompt
+        self.working_context = deque(maxlen=10)
         
         # Resource profile configuration
         self.current_profile = None
@@ -90,10 +282,32 @@ class VoiceAssistant:
         # Backend configuration
         self.backend_type = None  # 'msty' or 'ollama'
         self.backend_url = None
+        self.ollama_keep_alive = "30m"  # How long Ollama keeps the model loaded after a request
         self.backend_name = None
         self.backend_process = None  # Store process if we start it
         self.msty_url = "http://localhost:10000"
         self.ollama_url = "http://localhost:11434"
+        self.backend_check_cache = {}  # (url, backend_type) -> time it was last seen running
+        self.backend_check_ttl = 0.5
+        self.model_lists = {}  # url -> (fetched_at, parsed model list) from the last health check
+        self.model_list_ttl = 30
+
+        # Pooled keep-alive connections to the backend and the search API.
+        # Local backend calls are not retried; a dead backend should fail fast.
+        self.http = requests.Session()
+        self.http.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+        self.http.mount("https://", HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=1, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+
+        # Background network requests that overlap with speech
+        self.io_pool = ThreadPoolExecutor(max_workers=2)
+
+        # Instant answers by query, reused for a few minutes (query -> (fetched_at, data))
+        self.search_cache = {}
+        self.search_cache_ttl = 300
 
         # Audio configuration
         self.sample_rate = 16000
@@ -101,47 +315,179 @@ class VoiceAssistant:
         self.channels = 1
         self.format = pyaudio.paInt16
 
+        # The shared microphone stream delivers 20ms chunks through a callback
+        # (small chunks bound wake-word reaction time and match WebRTC VAD frames).
+        # The queue holds at most a few seconds so a stalled reader can't grow it
+        # without bound; the oldest audio is dropped first.
+        self.stream_chunk_size = 320
+        # While recording a command Vosk is fed ~100ms at a time; the wake and
+        # interruption loops still decode every chunk
+        self.decode_batch_chunks = 5
+        self.audio_queue = queue.Queue(maxsize=int(5 * self.sample_rate / self.stream_chunk_size))
+
+        # Chunks quieter than this skip Vosk while listening for the wake word or
+        # interruptions (recalibrated from the room's noise floor at startup)
+        self.speech_rms_threshold = 300
+        self.min_rms_threshold = 100
+        self.speech_hangover = 1.0  # seconds of quiet still fed to Vosk after speech
+        self.wake_preroll = 0.2  # seconds of quiet fed to Vosk ahead of a loud chunk
+
         # Initialize components
         self.audio = None
+        self.mic_stream = None
+        self.mic_lock = threading.Lock()
+        self.input_overflows = 0
+        # Stop event of the response being spoken, so a shutdown request can cut it short
+        self.speaking_stop_event = None
         self.vosk_model = None
+        self.stt_recognizer = None
+        self.wake_recognizer = None
+        self.interrupt_recognizer = None
         self.default_model = None
+
+        # Optional faster-whisper model for command transcription (e.g. "small.en" or a
+        # local model directory). Vosk still handles the wake word and interruptions.
+        self.whisper_model_name = None
+        self.whisper_device = "auto"  # Uses a CUDA GPU when available, otherwise the CPU
+        self.whisper_model = None
+
+        # WebRTC VAD (when installed) decides when a command has ended, so Vosk
+        # only decodes once speech has started. Frames must be 10, 20 or 30 ms.
+        self.vad = None
+        self.vad_aggressiveness = 2  # 0 (permissive) to 3 (strict)
+        self.vad_frame_bytes = int(self.sample_rate * 0.02) * 2
+        # Seconds of silence that end a command. VAD reacts per frame, while Vosk's
+        # partial hypothesis lags behind the end of speech and needs more margin.
+        self.silence_threshold = 1.5
+        self.vad_silence_threshold = 0.8
         self.setup_successful = False
 
+        # Persistent Piper process (keeps the voice model loaded between sentences)
+        self.piper_process = None
+        self.piper_output_dir = None
+        self.piper_lock = threading.Lock()
+        self.piper_sample_rate = 22050
+        # Voices in order of preference; "low" quality synthesizes about twice as fast
+        self.piper_voices = ["en_US-amy-low.onnx", "en_US-amy-medium.onnx"]
+
+        # Persistent aplay sink; playback_end is when queued audio finishes (monotonic)
+        self.aplay_process = None
+        self.aplay_latency = 0.1  # Matches the -B 100000 buffer
+        self.playback_end = 0.0
+
+        # Only one utterance plays at a time (re-entrant: speak() may hand off to
+        # speak_with_interruption())
+        self.tts_lock = threading.RLock()
+
+        # Synthesized audio for fixed prompts (callers opt in with cache=True, so
+        # one-off AI sentences never evict them)
+        self.tts_cache = OrderedDict()
+        self.tts_cache_size = 64
+        # The cache is also filled from the I/O pool while speaking (see prewarm_tts)
+        self.tts_cache_lock = threading.Lock()
+        # Fixed prompts synthesized at startup so they play with no Piper delay
+        self.tts_prewarm_phrases = (
+            "I didn't hear anything",
+            "I couldn't understand that",
+            "Sorry, I had trouble processing that",
+            "Let me search for that",
+            "Okay, bye!",
+        )
+
         print("🤖 Initializing Ziggy Voice Assistant...")
         self.setup_components()
 
     def setup_components(self):
         """Initialize all voice assistant components"""
         try:
-            # Initialize audio system
-            self.audio = pyaudio.PyAudio()
-            print("✅ Audio system initialized")
-
-            # Load Vosk model
-            model_paths = [
-                Path("vosk-model-small-en-us-0.15"),
-                Path("vosk-model-en-us-0.22"),
-                Path("vosk-model-en-us-0.22-lgraph"),
+            # Find the Vosk model
+            model_names = [
+                "vosk-model-small-en-us-0.15",
+                "vosk-model-en-us-0.22",
+                "vosk-model-en-us-0.22-lgraph",
             ]
 
+            # One directory scan instead of a stat per candidate; also lets us
+            # pick up other Vosk models the user may have unpacked
+            with os.scandir(".") as entries:
+                available_models = {entry.name for entry in entries
+                                    if entry.name.startswith("vosk-model") and entry.is_dir()}
+
             model_path = None
-            for path in model_paths:
-                if path.exists():
-                    model_path = str(path)
+            for name in model_names:
+                if name in available_models:
+                    model_path = name
                     break
 
+            if not model_path and available_models:
+                model_path = sorted(available_models)[0]
+                print(f"⚠️ Using unlisted Vosk model: {model_path}")
+
             if not model_path:
                 print("❌ No Vosk model found. Please download:")
                 print("wget https://alphacephei.com/vosk/models/vosk-model-small-en-us-0.15.zip")
                 print("unzip vosk-model-small-en-us-0.15.zip")
                 return
 
-            self.vosk_model = vosk.Model(model_path)
-            print("✅ Speech recognition model loaded")
+            # Loading the model takes a second or more; do it in the background
+            # while the audio system opens and calibrates
+            model_future = self.io_pool.submit(vosk.Model, model_path)
+
+            # Initialize audio system
+            self.audio = pyaudio.PyAudio()
+            # One long-lived microphone stream, started and stopped per reader,
+            # avoids renegotiating the ALSA device on every recording. PortAudio
+            # pushes each chunk into audio_queue from its own thread.
+            self.mic_stream = self.audio.open(
+                format=self.format,
+                channels=self.channels,
+                rate=self.sample_rate,
+                input=True,
+                frames_per_buffer=self.stream_chunk_size,
+                stream_callback=self.audio_callback,
+                start=False
+            )
+            print("✅ Audio system initialized")
+            self.calibrate_noise_floor()
 
             # Detect available memory and select profile
             self.detect_and_select_profile()
 
+            self.vosk_model = model_future.result()
+
+            # Recognizers are reused (with Reset) rather than rebuilt per utterance:
+            # one for commands, one for the wake word loop, one for interruptions
+            self.stt_recognizer = vosk.KaldiRecognizer(self.vosk_model, self.sample_rate)
+            # The wake loop only needs to tell a few phrases apart from everything
+            # else, so a grammar keeps the decoder graph tiny while idle
+            # (models without runtime grammar support ignore it)
+            wake_grammar = json.dumps([self.wake_word, self.shutdown_phrase, "[unk]"])
+            self.wake_recognizer = vosk.KaldiRecognizer(self.vosk_model, self.sample_rate, wake_grammar)
+            # Interruptions only ever need the wake word
+            interrupt_grammar = json.dumps([self.wake_word, "[unk]"])
+            self.interrupt_recognizer = vosk.KaldiRecognizer(self.vosk_model, self.sample_rate, interrupt_grammar)
+            print("✅ Speech recognition model loaded")
+
+            if self.whisper_model_name:
+                if WhisperModel is None:
+                    print("⚠️ faster-whisper not installed - using Vosk for transcription")
+                else:
+                    try:
+                        # Never download models at runtime; they must already be cached locally
+                        self.whisper_model = WhisperModel(
+                            self.whisper_model_name,
+                            device=self.whisper_device,
+                            compute_type="int8",
+                            local_files_only=True
+                        )
+                        print(f"✅ Whisper transcription model loaded ({self.whisper_model_name}, {self.whisper_device})")
+                    except Exception as e:
+                        print(f"⚠️ Could not load Whisper model, using Vosk: {e}")
+
+            if webrtcvad is not None:
+                self.vad = webrtcvad.Vad(self.vad_aggressiveness)
+                print("✅ Voice activity detection enabled")
+
             # Detect and setup AI backend
             if not self.setup_ai_backend():
                 return
@@ -154,9 +500,9 @@ class VoiceAssistant:
             # First try Piper
             self.piper_available = False
             self.piper_path = os.path.expanduser("~/.local/share/piper/piper/piper")
-            self.piper_model = os.path.expanduser("~/.local/share/piper/en_US-amy-medium.onnx")
-            
-            if os.path.exists(self.piper_path) and os.path.exists(self.piper_model):
+            self.piper_model = self.find_piper_voice()
+
+            if os.path.exists(self.piper_path) and self.piper_model:
                 try:
                     # Test Piper
                     result = subprocess.run(
@@ -164,7 +510,8 @@ class VoiceAssistant:
                         capture_output=True,
                         text=True
                     )
-                    if result.returncode == 0:
+                    if result.returncode == 0 and self.start_piper():
+                        self.start_aplay()
                         self.piper_available = True
                         print("✅ Piper TTS ready (natural voice)")
                 except Exception:
@@ -183,6 +530,11 @@ class VoiceAssistant:
                     print(f"❌ Text-to-speech error: {e}")
                     return
 
+            if os.environ.get("ZIGGY_WARMUP", "1") != "0":
+                # Load the AI model in the background while the speech models warm up
+                self.io_pool.submit(self.warmup_backend)
+                self.warmup()
+
             self.setup_successful = True
             print("🎉 All systems ready!")
 
@@ -190,13 +542,90 @@ class VoiceAssistant:
             print(f"❌ Setup failed: {e}")
             self.setup_successful = False
 
+    def calibrate_noise_floor(self, seconds=1.0):
+        """Set the speech loudness gate from a moment of background noise"""
+        try:
+            with self.input_stream() as audio_queue:
+                levels = [frame_rms(audio_queue.get(timeout=1))
+                          for _ in range(int(seconds * self.sample_rate / self.stream_chunk_size))]
+            # Anything more than three standard deviations above the room noise counts as sound
+            threshold = statistics.mean(levels) + 3 * statistics.pstdev(levels)
+            self.speech_rms_threshold = max(threshold, self.min_rms_threshold)
+            print(f"🔈 Noise floor calibrated (gate at {self.speech_rms_threshold:.0f} RMS)")
+        except Exception as e:
+            print(f"⚠️ Noise calibration failed, using default gate: {e}")
+
+    def is_loud(self, data):
+        """Whether a chunk is above the speech gate (compared as energy, so no square root)"""
+        return frame_energy(data) >= self.speech_rms_threshold ** 2 * (len(data) // 2)
+
+    def warmup(self):
+        """Run each speech model once so the first interaction isn't slowed by lazy loading"""
+        start = time.time()
+        silence = b'\x00\x00' * (self.sample_rate // 2)  # Half a second
+        try:
+            # Decoding through both recognizers faults in the model pages each one uses
+            for recognizer in (self.wake_recognizer, self.interrupt_recognizer, self.stt_recognizer):
+                recognizer.Reset()
+                recognizer.AcceptWaveform(silence)
+                recognizer.FinalResult()
+
+            if self.whisper_model:
+                self.speech_to_text_whisper(silence)
+
+            if self.piper_available:
+                # Also caches the wake word acknowledgment; the other fixed
+                # prompts are cached in the background
+                self.synthesize_piper("Yes?", cache=True)
+                self.io_pool.submit(self.prewarm_tts)
+        except Exception as e:
+            print(f"⚠️ Warmup error: {e}")
+        print(f"🔥 Models warmed up in {time.time() - start:.1f}s")
+
+    def prewarm_tts(self):
+        """Synthesize the fixed prompts into the TTS cache"""
+        for phrase in self.tts_prewarm_phrases:
+            if self.synthesize_piper(phrase, cache=True) is None:
+                break
+
+    def warmup_backend(self):
+        """Open the pooled connection and get the AI model loaded before the first question"""
+        start = time.time()
+        try:
+            if self.backend_type == "ollama":
+                # An empty chat just loads the model (and keeps it loaded for keep_alive)
+                url, payload = self.backend_request([], temperature=0, max_tokens=1, stream=False)
+            else:
+                url, payload = self.backend_request([{"role": "user", "content": "Hi"}],
+                                                    temperature=0, max_tokens=1, stream=False)
+            self.http.post(url, json=payload, timeout=60)
+            print(f"🔥 AI model warmed up in {time.time() - start:.1f}s")
+        except Exception as e:
+            print(f"⚠️ AI warmup error: {e}")
+
     def check_backend_running(self, url, backend_type):
-        """Check if a backend is running at the given URL"""
+        """Check if a backend is running at the given URL, reusing a very recent success"""
+        # Only successes are cached, so polling a backend that is starting up
+        # probes it every time
+        key = (url, backend_type)
+        seen_at = self.backend_check_cache.get(key)
+        if seen_at is not None and time.monotonic() - seen_at < self.backend_check_ttl:
+            return True
+
+        running = self.probe_backend(url, backend_type)
+        if running:
+            self.backend_check_cache[key] = time.monotonic()
+        else:
+            self.backend_check_cache.pop(key, None)
+        return running
+
+    def probe_backend(self, url, backend_type):
+        """Ask the given URL whether it is the expected backend"""
         try:
             if backend_type == "msty":
                 # First check if it's actually Ollama serving OpenAI-compatible API
                 try:
-                    ollama_check = requests.get(f"{url}/api/tags", timeout=1)
+                    ollama_check = self.http.get(f"{url}/api/tags", timeout=0.5)
                     if ollama_check.status_code == 200:
                         # It's Ollama, not Msty
                         return False
@@ -204,22 +633,25 @@ class VoiceAssistant:
                     pass
                 
                 # Now check for Msty
-                response = requests.get(f"{url}/v1/models", timeout=2)
+                response = self.http.get(f"{url}/v1/models", timeout=0.5)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = json_loads(response.content)
                     # Check for model ownership pattern - Ollama uses "library", Msty doesn't
                     if 'data' in data and data['data']:
                         # Check if this is Ollama masquerading as OpenAI API
                         first_model = data['data'][0]
                         if first_model.get('owned_by') == 'library':
                             return False  # This is Ollama, not Msty
+                        self.model_lists[url] = (time.monotonic(), data)
                         return True  # This is likely Msty
                     return False
             else:  # ollama
-                response = requests.get(f"{url}/api/tags", timeout=2)
+                response = self.http.get(f"{url}/api/tags", timeout=0.5)
                 if response.status_code == 200:
-                    data = response.json()
-                    return 'models' in data
+                    data = json_loads(response.content)
+                    if 'models' in data:
+                        self.model_lists[url] = (time.monotonic(), data)
+                        return True
             return False
         except:
             return False
@@ -257,15 +689,22 @@ class VoiceAssistant:
                     stderr=subprocess.DEVNULL
                 )
             
-            # Wait for backend to be ready (up to 30 seconds)
+            # Wait for backend to be ready (up to 30 seconds), backing off from a
+            # quick first poll since a warm start is often up almost immediately
             url = self.msty_url if backend_type == "msty" else self.ollama_url
-            for i in range(30):
-                time.sleep(1)
+            start = time.monotonic()
+            delay = 0.1
+            next_report = 0
+            while time.monotonic() - start < 30:
+                time.sleep(delay)
+                delay = min(delay * 1.5, 2.0)
                 if self.check_backend_running(url, backend_type):
                     print(f"✅ {backend_type.capitalize()} backend started successfully")
                     return True
-                if i % 5 == 0:
-                    print(f"⏳ Waiting for {backend_type} to start... ({i+1}/30)")
+                elapsed = time.monotonic() - start
+                if elapsed >= next_report:
+                    print(f"⏳ Waiting for {backend_type} to start... ({int(elapsed)}s/30s)")
+                    next_report += 5
             
             print(f"❌ {backend_type.capitalize()} failed to start within 30 seconds")
             return False
@@ -311,7 +750,7 @@ class VoiceAssistant:
         # Record user response
         print("🎤 Listening for your choice...")
         audio_data = self.record_backend_choice()
-        if not audio_data:
+        if audio_data is None:
             print("❌ No response detected")
             return False
         
@@ -340,7 +779,7 @@ class VoiceAssistant:
             ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             audio_data = self.record_backend_choice()
-            if not audio_data:
+            if audio_data is None:
                 return False
             
             choice_text = self.speech_to_text(audio_data)
@@ -381,25 +820,14 @@ class VoiceAssistant:
     def record_backend_choice(self):
         """Simple recording for backend choice - before full init"""
         try:
-            if not self.audio:
-                self.audio = pyaudio.PyAudio()
-            
-            stream = self.audio.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.chunk_size
-            )
-            
-            frames = []
-            # Record for 3 seconds
-            for _ in range(0, int(self.sample_rate / self.chunk_size * 3)):
-                data = stream.read(self.chunk_size, exception_on_overflow=False)
-                frames.append(data)
-            
-            stream.close()
-            return b''.join(frames)
+            # Record for 3 seconds straight into one preallocated buffer
+            chunk_bytes = self.stream_chunk_size * 2  # 16-bit mono
+            audio = bytearray(int(self.sample_rate / self.stream_chunk_size * 3) * chunk_bytes)
+            view = memoryview(audio)
+            with self.input_stream() as audio_queue:
+                for offset in range(0, len(audio), chunk_bytes):
+                    view[offset:offset + chunk_bytes] = audio_queue.get(timeout=1)
+            return audio
             
         except Exception as e:
             print(f"Recording error: {e}")
@@ -479,6 +907,7 @@ class VoiceAssistant:
             if profile_name in RESOURCE_PROFILES:
                 self.current_profile = profile_name
                 self.profile_settings = RESOURCE_PROFILES[profile_name].copy()
+                self.apply_history_limit()
                 print(f"✅ Using specified profile: {self.profile_settings['name']}")
                 return
         
@@ -495,12 +924,43 @@ class VoiceAssistant:
             self.current_profile = "performance"
         
         self.profile_settings = RESOURCE_PROFILES[self.current_profile].copy()
+        self.apply_history_limit()
         print(f"✅ Selected {self.profile_settings['name']} profile ({memory_gb:.1f}GB available)")
 
+    def apply_history_limit(self):
+        """Bound conversation history to the current profile (user + assistant per exchange)"""
+        limit = self.profile_settings['history_limit'] * 2
+        history = self.conversation_history
+        if len(history) > limit + self.history_trim_batch * 2:
+            for _ in range(len(history) - limit):
+                self.remember_facts(history.popleft())
+                self.history_tokens.popleft()
+
+    def remember_facts(self, message):
+        """Keep personal details from a trimmed user message without another AI call"""
+        if message['role'] != 'user':
+            return
+        for phrase, value in MEMORY_FACT_RE.findall(message['content']):
+            fact = f"{phrase} {value.strip()}".lower()
+            if fact not in self.working_context:
+                self.working_context.append(fact)
+
+    def clear_history(self):
+        """Forget the conversation, including facts kept from trimmed exchanges"""
+        self.conversation_history.clear()
+        self.history_tokens.clear()
+        self.working_context.clear()
+
+    def add_to_history(self, user_text, assistant_text):
+        """Record one exchange, trimming old ones in batches"""
+        self.conversation_history.append({"role": "user", "content": user_text})
+        self.conversation_history.append({"role": "assistant", "content": assistant_text})
+        self.history_tokens.append(self.estimate_tokens(user_text))
+        self.history_tokens.append(self.estimate_tokens(assistant_text))
+        self.apply_history_limit()
+
     def switch_profile(self, profile_name):
-        """Switch to a different resource profile"""
-        profile_name = profile_name.lower()
-        
+        """Switch to a different resource profile (expects a lowercase name)"""
         # Handle aliases
         aliases = {
             "gaming": "minimal",
@@ -526,9 +986,8 @@ class VoiceAssistant:
         self.current_profile = profile_name
         self.profile_settings = RESOURCE_PROFILES[profile_name].copy()
         
-        # Clear excess history if switching to lower profile
-        if len(self.conversation_history) > self.profile_settings['history_limit'] * 2:
-            self.conversation_history = self.conversation_history[-(self.profile_settings['history_limit'] * 2):]
+        # Drops the oldest history if switching to lower profile
+        self.apply_history_limit()
         
         return f"Switched from {old_profile} to {self.profile_settings['name']} profile. {self.profile_settings['description']}"
 
@@ -552,13 +1011,26 @@ class VoiceAssistant:
             "percent": percent_used
         }
 
+    def get_model_list(self):
+        """Model list of the current backend, reusing the one fetched by the health check"""
+        cached = self.model_lists.get(self.backend_url)
+        if cached and time.monotonic() - cached[0] < self.model_list_ttl:
+            return cached[1]
+
+        path = "/v1/models" if self.backend_type == "msty" else "/api/tags"
+        response = self.http.get(f"{self.backend_url}{path}", timeout=5)
+        if response.status_code != 200:
+            return None
+        models_data = json_loads(response.content)
+        self.model_lists[self.backend_url] = (time.monotonic(), models_data)
+        return models_data
+
     def get_default_model(self):
         """Get the default model for the current backend"""
         try:
-            if self.backend_type == "msty":
-                response = requests.get(f"{self.backend_url}/v1/models", timeout=5)
-                if response.status_code == 200:
-                    models_data = response.json()
+            models_data = self.get_model_list()
+            if models_data is not None:
+                if self.backend_type == "msty":
                     if 'data' in models_data and models_data['data']:
                         self.default_model = models_data['data'][0]['id']
                         print(f"✅ Using model: {self.default_model}")
@@ -567,10 +1039,7 @@ class VoiceAssistant:
                         self.default_model = "llama3.2:latest"
                         print(f"✅ Using fallback model: {self.default_model}")
                         return True
-            else:  # ollama
-                response = requests.get(f"{self.backend_url}/api/tags", timeout=5)
-                if response.status_code == 200:
-                    models_data = response.json()
+                else:  # ollama
                     if 'models' in models_data and models_data['models']:
                         self.default_model = models_data['models'][0]['name']
                         print(f"✅ Using model: {self.default_model}")
@@ -579,7 +1048,7 @@ class VoiceAssistant:
                         self.default_model = "llama2"
                         print(f"✅ Using fallback model: {self.default_model}")
                         return True
-                        
+
             print("❌ Could not get model list from backend")
             return False
                 
@@ -587,151 +1056,325 @@ class VoiceAssistant:
             print(f"❌ Error getting models: {e}")
             return False
 
-    def query_backend(self, messages, temperature=0.7, max_tokens=500):
-        """Unified interface to query either backend"""
-        try:
-            if self.backend_type == "msty":
-                # Msty uses OpenAI-compatible API
-                payload = {
-                    "model": self.default_model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens
-                }
-                
-                response = requests.post(
-                    f"{self.backend_url}/v1/chat/completions",
-                    json=payload,
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result['choices'][0]['message']['content'].strip()
-                    
-            else:  # ollama
-                # Ollama uses its own API format
-                # Convert messages to Ollama format
-                prompt = ""
-                for msg in messages:
-                    if msg['role'] == 'system':
-                        prompt += f"System: {msg['content']}\n"
-                    elif msg['role'] == 'user':
-                        prompt += f"User: {msg['content']}\n"
-                    elif msg['role'] == 'assistant':
-                        prompt += f"Assistant: {msg['content']}\n"
-                prompt += "Assistant: "
-                
-                payload = {
-                    "model": self.default_model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": temperature,
-                        "num_predict": max_tokens
-                    }
-                }
-                
-                response = requests.post(
-                    f"{self.backend_url}/api/generate",
-                    json=payload,
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result['response'].strip()
-            
-            return None
-            
-        except Exception as e:
-            print(f"Backend query error: {e}")
-            return None
+    def backend_request(self, messages, temperature, max_tokens, stream):
+        """Build the endpoint URL and payload for the active backend"""
+        if self.backend_type == "msty":
+            # Msty uses OpenAI-compatible API
+            payload = {
+                "model": self.default_model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": stream
+            }
+            return f"{self.backend_url}/v1/chat/completions", payload
+
+        # Ollama's chat API applies the model's own template and can reuse the
+        # cached prompt prefix; keep_alive stops the model unloading between turns
+        payload = {
+            "model": self.default_model,
+            "messages": messages,
+            "stream": stream,
+            "keep_alive": self.ollama_keep_alive,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
+        }
+        return f"{self.backend_url}/api/chat", payload
 
-    def speak(self, text, allow_interruption=True):
-        """Convert text to speech with optional interruption capability"""
+    def stream_backend(self, messages, temperature=0.7, max_tokens=500):
+        """Yield response text from either backend as it is generated"""
         try:
-            print(f"🗣️ Speaking: {text}")
-
-            if not allow_interruption or len(text) < 100:
-                # Short responses - speak normally without interruption
-                if self.piper_available:
-                    # Use Piper for natural voice
-                    # Escape single quotes in text
-                    escaped_text = text.replace("'", "'\"'\"'")
-                    process = subprocess.Popen(
-                        f"echo '{escaped_text}' | {self.piper_path} --model {self.piper_model} --output-raw",
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.DEVNULL
-                    )
-                    # Play the audio
-                    play_process = subprocess.Popen(
-                        ['aplay', '-r', '22050', '-f', 'S16_LE', '-t', 'raw', '-'],
-                        stdin=process.stdout,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                    play_process.wait()
-                else:
-                    # Fallback to espeak
-                    subprocess.run([
-                        'espeak',
-                        '-s', '150',  # Speed (words per minute)
-                        '-v', 'en',  # Voice (English)
-                        text
-                    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                return False  # Not interrupted
+            url, payload = self.backend_request(messages, temperature, max_tokens, stream=True)
+            with self.http.post(url, json=payload, timeout=30, stream=True) as response:
+                if response.status_code != 200:
+                    print(f"Backend stream error: {response.status_code}")
+                    return
+
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+
+                    if self.backend_type == "msty":
+                        # Server-sent events: "data: {...}" lines, ending with "data: [DONE]"
+                        if not line.startswith(b'data: '):
+                            continue
+                        data = line[6:]
+                        if data == b'[DONE]':
+                            break
+                        choices = json_loads(data).get('choices')
+                        text = choices[0].get('delta', {}).get('content') if choices else None
+                    else:
+                        # One JSON object per line
+                        chunk = json_loads(line)
+                        text = chunk.get('message', {}).get('content')
+                        if chunk.get('done'):
+                            if text:
+                                yield text
+                            break
 
-            # Long responses - enable interruption
-            return self.speak_with_interruption(text)
+                    if text:
+                        yield text
 
         except Exception as e:
-            print(f"Speech error: {e}")
+            print(f"Backend stream error: {e}")
+
+    def stream_sentences(self, chunks):
+        """Group streamed text into sentences long enough to be worth synthesizing"""
+        buffer = ""
+        for chunk in chunks:
+            buffer += chunk
+
+            # Cut at sentence ends once a piece has a few words; shorter sentences
+            # (often abbreviations) are joined to the next. Punctuation is kept
+            # so Piper gets the right intonation.
+            start = 0
+            for match in SENTENCE_END_RE.finditer(buffer):
+                if len(buffer[start:match.end()].split()) >= 5:
+                    yield buffer[start:match.end()].strip()
+                    start = match.end()
+            buffer = buffer[start:]
+
+        if buffer.strip():
+            yield buffer.strip()
+
+    def find_piper_voice(self):
+        """Pick the Piper voice to use and read its sample rate from the voice config"""
+        # ZIGGY_PIPER_MODEL overrides; otherwise the first installed voice wins
+        candidates = [os.environ.get('ZIGGY_PIPER_MODEL')] + [
+            os.path.expanduser(f"~/.local/share/piper/{voice}") for voice in self.piper_voices]
+        for model in candidates:
+            if model and os.path.exists(model):
+                try:
+                    with open(f"{model}.json") as f:
+                        self.piper_sample_rate = json.load(f)['audio']['sample_rate']
+                except (OSError, ValueError, KeyError):
+                    pass  # Keep the default rate
+                return model
+        return None
+
+    def start_piper(self):
+        """Start a long-lived Piper process that synthesizes one line at a time"""
+        try:
+            if not self.piper_output_dir:
+                self.piper_output_dir = tempfile.mkdtemp(prefix="ziggy-piper-")
+
+            # In output-dir mode Piper writes one WAV per input line and prints its path
+            self.piper_process = subprocess.Popen(
+                [self.piper_path, '--model', self.piper_model, '--output_dir', self.piper_output_dir],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+            return True
+        except Exception as e:
+            print(f"⚠️ Could not start Piper: {e}")
+            self.piper_process = None
             return False
 
-    def speak_with_interruption(self, text):
-        """Speak text while listening for 'ziggy' interruption"""
+    def synthesize_piper(self, text, cache=False):
+        """Synthesize text with the persistent Piper process and return raw PCM"""
+        # Canned prompts ("Yes?", permission questions...) repeat all session
+        if cache:
+            with self.tts_cache_lock:
+                pcm = self.tts_cache.get(text)
+                if pcm is not None:
+                    self.tts_cache.move_to_end(text)
+                    return pcm
+
+        with self.piper_lock:
+            # Restart Piper if it has exited
+            if self.piper_process is None or self.piper_process.poll() is not None:
+                if not self.start_piper():
+                    return None
+
+            # Piper treats each line as one utterance
+            try:
+                self.piper_process.stdin.write(' '.join(text.split()) + '\n')
+                self.piper_process.stdin.flush()
+                wav_path = self.piper_process.stdout.readline().strip()
+            except (BrokenPipeError, OSError) as e:
+                print(f"⚠️ Piper error: {e}")
+                return None
+
+        if not wav_path:
+            return None
+
         try:
-            # Break text into sentences for chunked speaking
-            sentences = self.split_into_sentences(text)
+            with wave.open(wav_path, 'rb') as wf:
+                pcm = wf.readframes(wf.getnframes())
+        finally:
+            Path(wav_path).unlink(missing_ok=True)
+
+        if cache and pcm:
+            with self.tts_cache_lock:
+                self.tts_cache[text] = pcm
+                if len(self.tts_cache) > self.tts_cache_size:
+                    self.tts_cache.popitem(last=False)
+
+        return pcm
+
+    def start_aplay(self):
+        """Start the persistent aplay sink that all Piper audio is queued on"""
+        self.aplay_process = subprocess.Popen(
+            ['aplay', '-q', '-B', '100000', '-r', str(self.piper_sample_rate),
+             '-f', 'S16_LE', '-t', 'raw', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        self.playback_end = 0.0
+
+    def play_pcm(self, pcm):
+        """Queue raw Piper audio on the aplay sink and track when it will finish"""
+        if self.aplay_process is None or self.aplay_process.poll() is not None:
+            self.start_aplay()
+
+        now = time.monotonic()
+        self.playback_end = (max(self.playback_end, now + self.aplay_latency)
+                             + len(pcm) / (2 * self.piper_sample_rate))
+        try:
+            # Blocks only while the pipe is full, so the next sentence is
+            # synthesized while this one is still playing
+            self.aplay_process.stdin.write(pcm)
+            self.aplay_process.stdin.flush()
+        except (BrokenPipeError, ValueError, AttributeError):
+            pass  # Playback was interrupted
+
+    def wait_for_playback(self, stop_event=None):
+        """Wait until queued audio has played, returning early if stop_event is set"""
+        remaining = self.playback_end - time.monotonic()
+        if remaining <= 0:
+            return
+        if stop_event is None:
+            time.sleep(remaining)
+        else:
+            stop_event.wait(remaining)
+
+    def interrupt_playback(self):
+        """Cut off queued audio immediately (the sink is restarted on next use)"""
+        process = self.aplay_process
+        self.aplay_process = None
+        self.playback_end = 0.0
+        if process and process.poll() is None:
+            process.kill()
+            process.wait()
+
+    def stop_piper(self):
+        """Stop the persistent Piper process and remove its output directory"""
+        if self.piper_process and self.piper_process.poll() is None:
+            self.piper_process.terminate()
+            try:
+                self.piper_process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.piper_process.kill()
+        self.piper_process = None
+
+        if self.piper_output_dir:
+            shutil.rmtree(self.piper_output_dir, ignore_errors=True)
+            self.piper_output_dir = None
+
+    def speak(self, text, allow_interruption=True, cache=False):
+        """Convert text to speech with optional interruption capability (cache=True for fixed prompts)"""
+        with self.tts_lock:
+            try:
+                if isinstance(text, StreamedResponse):
+                    # Streamed AI responses are spoken sentence by sentence as they arrive
+                    return self.speak_with_interruption(text)
+
+                print(f"🗣️ Speaking: {text}")
+
+                if not allow_interruption or len(text) < 100:
+                    # Short responses - speak normally without interruption
+                    if self.piper_available:
+                        # Use Piper for natural voice
+                        pcm = self.synthesize_piper(text, cache=cache)
+                        if pcm:
+                            self.play_pcm(pcm)
+                            self.wait_for_playback()
+                    else:
+                        # Fallback to espeak
+                        subprocess.run([
+                            'espeak',
+                            '-s', '150',  # Speed (words per minute)
+                            '-v', 'en',  # Voice (English)
+                            text
+                        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    return False  # Not interrupted
+
+                # Long responses - enable interruption
+                return self.speak_with_interruption(text)
 
-            # Setup interruption detection
-            interruption_queue = queue.Queue()
+            except Exception as e:
+                print(f"Speech error: {e}")
+                return False
+
+    def speak_with_interruption(self, text):
+        """Speak text while listening for 'ziggy' interruption"""
+        with self.tts_lock:
             stop_speaking = threading.Event()
+            self.speaking_stop_event = stop_speaking
+            try:
+                # Break text into sentences for chunked speaking
+                streamed = isinstance(text, StreamedResponse)
+                sentences = text if streamed else self.split_into_sentences(text)
 
-            # Start listening for interruption in background
-            listener_thread = threading.Thread(
-                target=self.listen_for_interruption,
-                args=(interruption_queue, stop_speaking)
-            )
-            listener_thread.daemon = True
-            listener_thread.start()
+                # Setup interruption detection
+                interruption_queue = queue.Queue()
 
-            # Speak each sentence, checking for interruption
-            for i, sentence in enumerate(sentences):
-                if stop_speaking.is_set():
-                    print("🛑 Speech interrupted by wake word")
-                    break
+                # Start listening for interruption in background
+                listener_thread = threading.Thread(
+                    target=self.listen_for_interruption,
+                    args=(interruption_queue, stop_speaking)
+                )
+                listener_thread.daemon = True
+                listener_thread.start()
+
+                # Stop playback as soon as an interruption is signalled, rather
+                # than polling the player process
+                playback = {"process": None}
+                # Piper sentences queued on the sink, with the time their audio ends;
+                # they only count as spoken once that time has passed
+                queued = deque()
+
+                def settle(now):
+                    while queued and queued[0][0] <= now:
+                        text.mark_spoken(queued.popleft()[1])
+
+                def stop_playback():
+                    stop_speaking.wait()
+                    if not interruption_queue.empty():
+                        self.interrupt_playback()
+                    process = playback["process"]
+                    if process and process.poll() is None:
+                        process.terminate()
+
+                threading.Thread(target=stop_playback, daemon=True).start()
+
+                # Speak each sentence, checking for interruption
+                for i, sentence in enumerate(sentences):
+                    settle(time.monotonic())
+                    if stop_speaking.is_set():
+                        print("🛑 Speech interrupted by wake word")
+                        break
+
+                    if streamed:
+                        print(f"🗣️ Speaking: {sentence}")
+
+                    # Speak this sentence
+                    if self.piper_available:
+                        # Use the persistent Piper process and queue the audio on
+                        # the aplay sink without waiting for it to play
+                        pcm = self.synthesize_piper(sentence.strip())
+                        if pcm and not stop_speaking.is_set():
+                            self.play_pcm(pcm)
+                            if streamed:
+                                queued.append((self.playback_end, sentence))
+                        continue
 
-                # Speak this sentence
-                if self.piper_available:
-                    # Use Piper
-                    # Escape single quotes in sentence
-                    escaped_sentence = sentence.strip().replace("'", "'\"'\"'")
-                    piper_process = subprocess.Popen(
-                        f"echo '{escaped_sentence}' | {self.piper_path} --model {self.piper_model} --output-raw",
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.DEVNULL
-                    )
-                    process = subprocess.Popen(
-                        ['aplay', '-r', '22050', '-f', 'S16_LE', '-t', 'raw', '-'],
-                        stdin=piper_process.stdout,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                else:
                     # Use espeak
                     process = subprocess.Popen([
                         'espeak',
@@ -740,99 +1383,144 @@ class VoiceAssistant:
                         sentence.strip()
                     ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-                # Wait for sentence to finish, checking for interruption
-                while process.poll() is None:
+                    playback["process"] = process
                     if stop_speaking.is_set():
+                        # Interrupted before the watcher could see this process
                         process.terminate()
+
+                    # Wait for sentence to finish (terminated early on interruption)
+                    process.wait()
+                    if stop_speaking.is_set():
                         print("🛑 Speech interrupted mid-sentence")
                         break
-                    time.sleep(0.1)
+                    if streamed:
+                        text.mark_spoken(sentence)
 
-            # Stop the listener
-            stop_speaking.set()
+                if self.piper_available and not stop_speaking.is_set():
+                    # Let the queued audio finish (cut short on interruption)
+                    self.wait_for_playback(stop_speaking)
+                    if stop_speaking.is_set():
+                        print("🛑 Speech interrupted mid-sentence")
+
+                # Everything queued has played unless we were cut short
+                settle(time.monotonic() if stop_speaking.is_set() else math.inf)
+
+                # Stop the listener (also releases the playback watcher)
+                stop_speaking.set()
+                if streamed:
+                    # Stops generation if we were interrupted
+                    text.close()
+
+                # Check if we were interrupted
+                try:
+                    interruption_detected = interruption_queue.get_nowait()
+                    return True  # Was interrupted
+                except queue.Empty:
+                    return False  # Completed normally
+
+            except Exception as e:
+                print(f"Interruptible speech error: {e}")
+                stop_speaking.set()
+                if isinstance(text, StreamedResponse):
+                    text.close()
+                return False
+            finally:
+                self.speaking_stop_event = None
+
+    def is_speech(self, data):
+        """Whether WebRTC VAD hears speech in any full frame of a chunk"""
+        step = self.vad_frame_bytes
+        for offset in range(0, len(data) - step + 1, step):
+            if self.vad.is_speech(data[offset:offset + step], self.sample_rate):
+                return True
+        return False
+
+    def audio_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio callback for the shared microphone stream"""
+        # PortAudio reports lost input through the status flags; count it here and
+        # report from the reader, since printing from this thread could stall capture
+        if status & pyaudio.paInputOverflow:
+            self.input_overflows += 1
 
-            # Check if we were interrupted
+        # Never block PortAudio's thread - drop the oldest chunk if the reader fell behind
+        try:
+            self.audio_queue.put_nowait(in_data)
+        except queue.Full:
             try:
-                interruption_detected = interruption_queue.get_nowait()
-                return True  # Was interrupted
+                self.audio_queue.get_nowait()
             except queue.Empty:
-                return False  # Completed normally
-
-        except Exception as e:
-            print(f"Interruptible speech error: {e}")
-            return False
+                pass
+            self.audio_queue.put_nowait(in_data)
+        return (None, pyaudio.paContinue)
+
+    @contextmanager
+    def input_stream(self):
+        """Lend the shared microphone audio queue to one reader at a time"""
+        with self.mic_lock:
+            # Drop anything left over from the previous reader
+            while not self.audio_queue.empty():
+                self.audio_queue.get_nowait()
+            self.input_overflows = 0
+            self.mic_stream.start_stream()
+            try:
+                yield self.audio_queue
+            finally:
+                self.mic_stream.stop_stream()
+                if self.input_overflows:
+                    print(f"⚠️ Microphone input overflowed {self.input_overflows} times - "
+                          f"consider a larger stream_chunk_size")
 
     def listen_for_interruption(self, interruption_queue, stop_event):
         """Listen for 'ziggy' wake word during speech"""
         try:
-            # Create a separate recognizer for interruption detection
-            recognizer = vosk.KaldiRecognizer(self.vosk_model, self.sample_rate)
+            recognizer = self.interrupt_recognizer
+            recognizer.Reset()
 
-            # Open audio stream for interruption detection
-            stream = self.audio.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.chunk_size
-            )
+            # Borrow the shared microphone stream for interruption detection
+            with self.input_stream() as audio_queue:
+                print("👂 Listening for interruption...")
 
-            print("👂 Listening for interruption...")
+                # Keep feeding Vosk briefly after the last loud chunk so it can endpoint
+                hangover_chunks = max(1, int(self.speech_hangover * self.sample_rate / self.stream_chunk_size))
+                quiet_chunks = hangover_chunks
 
-            while not stop_event.is_set():
-                try:
-                    data = stream.read(self.chunk_size, exception_on_overflow=False)
+                while not stop_event.is_set():
+                    try:
+                        data = audio_queue.get(timeout=1)
 
-                    if recognizer.AcceptWaveform(data):
-                        result = json.loads(recognizer.Result())
-                        if result.get('text'):
-                            transcript = result['text'].lower().strip()
+                        if self.is_loud(data):
+                            quiet_chunks = 0
+                        else:
+                            quiet_chunks += 1
+                            if quiet_chunks > hangover_chunks:
+                                continue
 
-                            # Check for wake word
-                            if self.wake_word in transcript:
-                                print(f"🎉 Interruption detected: '{transcript}'")
-                                interruption_queue.put(True)
-                                stop_event.set()
-                                break
-
-                except Exception as e:
-                    if not stop_event.is_set():
-                        print(f"Interruption listening error: {e}")
-                        time.sleep(0.1)
+                        if recognizer.AcceptWaveform(data):
+                            transcript = json_loads(recognizer.Result()).get('text', '')
+                        else:
+                            # Check the running hypothesis so we don't wait for Vosk to
+                            # finalize the utterance
+                            transcript = json_loads(recognizer.PartialResult()).get('partial', '')
+
+                        # Check for wake word
+                        if self.wake_word in transcript:
+                            print(f"🎉 Interruption detected: '{transcript}'")
+                            recognizer.Reset()
+                            interruption_queue.put(True)
+                            stop_event.set()
+                            break
 
-            stream.close()
+                    except Exception as e:
+                        if not stop_event.is_set():
+                            print(f"Interruption listening error: {e}")
+                            time.sleep(0.1)
 
         except Exception as e:
             print(f"Interruption listener setup error: {e}")
 
     def split_into_sentences(self, text):
         """Split text into sentences for chunked speaking"""
-        # Simple sentence splitting
-        import re
-
-        # Split on periods, exclamation marks, question marks
-        sentences = re.split(r'[.!?]+', text)
-
-        # Clean up and filter empty sentences
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        # If no sentences found, return original text
-        if not sentences:
-            return [text]
-
-        # Rejoin sentences that are too short (likely abbreviations)
-        cleaned_sentences = []
-        current_sentence = ""
-
-        for sentence in sentences:
-            current_sentence += sentence + ". "
-
-            # If sentence is reasonable length or we're at the end, add it
-            if len(current_sentence.split()) >= 5 or sentence == sentences[-1]:
-                cleaned_sentences.append(current_sentence.strip())
-                current_sentence = ""
-
-        return cleaned_sentences if cleaned_sentences else [text]
+        return list(self.stream_sentences([text])) or [text]
 
     def contains_question(self, text):
         """Check if the text contains a question"""
@@ -845,20 +1533,10 @@ class VoiceAssistant:
             return True
         
         # Check for question words at the beginning of sentences
-        question_starters = [
-            'what', 'where', 'when', 'who', 'why', 'how',
-            'would', 'could', 'should', 'can', 'will', 'do',
-            'does', 'did', 'is', 'are', 'was', 'were',
-            'have', 'has', 'had', 'may', 'might'
-        ]
-        
-        # Split into sentences and check each
-        sentences = text.split('.')
-        for sentence in sentences:
-            sentence = sentence.strip().lower()
-            if any(sentence.startswith(word + ' ') for word in question_starters):
-                print(f"   ✓ Found question starter: {sentence[:30]}...")
-                return True
+        match = QUESTION_START_RE.search(text)
+        if match:
+            print(f"   ✓ Found question starter: {text[match.start():match.start() + 30].lstrip('. ')}...")
+            return True
         
         print("   ✗ No question detected")
         return False
@@ -873,37 +1551,40 @@ class VoiceAssistant:
         now = datetime.now()
         return f"Today is {now.strftime('%A, %B %d, %Y')}"
 
-    def handle_conversion(self, text):
-        """Handle unit conversions - local function"""
-        text_lower = text.lower()
+    def handle_conversion(self, text_lower):
+        """Handle unit conversions - local function (expects normalized lowercase text)"""
 
         # Temperature conversion
-        if 'celsius' in text_lower and 'fahrenheit' in text_lower:
-            numbers = re.findall(r'-?\d+\.?\d*', text)
-            if numbers:
-                if 'celsius' in text_lower.split('fahrenheit')[0]:
+        celsius_idx = text_lower.find('celsius')
+        fahrenheit_idx = text_lower.find('fahrenheit')
+        if celsius_idx != -1 and fahrenheit_idx != -1:
+            number = NUMBER_RE.search(text_lower)
+            if number:
+                if celsius_idx < fahrenheit_idx:
                     # Celsius to Fahrenheit
-                    celsius = float(numbers[0])
+                    celsius = float(number.group())
                     fahrenheit = (celsius * 9 / 5) + 32
                     return f"{celsius} degrees Celsius is {fahrenheit:.1f} degrees Fahrenheit"
                 else:
                     # Fahrenheit to Celsius
-                    fahrenheit = float(numbers[0])
+                    fahrenheit = float(number.group())
                     celsius = (fahrenheit - 32) * 5 / 9
                     return f"{fahrenheit} degrees Fahrenheit is {celsius:.1f} degrees Celsius"
 
         # Distance conversion
-        if 'feet' in text_lower and 'meters' in text_lower:
-            numbers = re.findall(r'-?\d+\.?\d*', text)
-            if numbers:
-                if 'feet' in text_lower.split('meters')[0]:
+        feet_idx = text_lower.find('feet')
+        meters_idx = text_lower.find('meters')
+        if feet_idx != -1 and meters_idx != -1:
+            number = NUMBER_RE.search(text_lower)
+            if number:
+                if feet_idx < meters_idx:
                     # Feet to meters
-                    feet = float(numbers[0])
+                    feet = float(number.group())
                     meters = feet * 0.3048
                     return f"{feet} feet is {meters:.2f} meters"
                 else:
                     # Meters to feet
-                    meters = float(numbers[0])
+                    meters = float(number.group())
                     feet = meters / 0.3048
                     return f"{meters} meters is {feet:.2f} feet"
 
@@ -917,23 +1598,19 @@ class VoiceAssistant:
         self.conversational_mode = True
         
         # Use non-interruptible speech for permission requests (they're short)
-        self.speak(permission_text, allow_interruption=False)
+        self.speak(permission_text, allow_interruption=False, cache=True)
         print(f"🌐 Requesting online permission for: {query_type}")
 
         # Record user response in conversational mode
-        response_audio = self.record_command(duration=3, conversational=True)
-        if response_audio:
-            response_text = self.speech_to_text(response_audio)
-            response_lower = response_text.lower().strip()
+        response_text = self.record_and_transcribe(duration=3, conversational=True)
+        if response_text is not None:
+            response_lower = response_text.casefold()
 
             # Check for affirmative responses
-            affirmative_words = ['yes', 'yeah', 'yep', 'okay', 'ok', 'sure', 'go ahead', 'please']
-            negative_words = ['no', 'nope', 'don\'t', 'stop', 'cancel', 'nevermind']
-
-            if any(word in response_lower for word in affirmative_words):
+            if AFFIRMATIVE_RE.search(response_lower):
                 print(f"✅ Online permission granted")
                 return True
-            elif any(word in response_lower for word in negative_words):
+            elif NEGATIVE_RE.search(response_lower):
                 print(f"❌ Online permission denied")
                 return False
             else:
@@ -950,54 +1627,82 @@ class VoiceAssistant:
         if not self.request_online_permission("web search"):
             return "Okay, staying local. Is there anything else I can help you with?"
 
+        # Permission granted - start fetching while the user decides
+        search = self.start_search(query)
+
         # Offer two options
         options_text = "Would you like me to read you the answer, or open a browser window?"
         
         # Stay in conversational mode
         self.conversational_mode = True
         
-        self.speak(options_text, allow_interruption=False)  # Short question
+        self.speak(options_text, allow_interruption=False, cache=True)  # Short question
         print(f"🤔 Asking user preference: read vs browse")
 
         # Record user response in conversational mode
-        response_audio = self.record_command(duration=4, conversational=True)
-        if response_audio:
-            response_text = self.speech_to_text(response_audio)
-            response_lower = response_text.lower().strip()
+        response_text = self.record_and_transcribe(duration=4, conversational=True)
+        if response_text is not None:
+            response_lower = response_text.casefold()
             print(f"📝 User choice: '{response_text}'")
 
             # Check what user wants
-            read_words = ['read', 'tell', 'say', 'speak', 'answer']
-            browse_words = ['browser', 'open', 'window', 'firefox', 'chrome']
-
-            if any(word in response_lower for word in read_words):
+            if READ_CHOICE_RE.search(response_lower):
                 print("📖 User chose: read results")
-                return self.fetch_and_read_results(query)
-            elif any(word in response_lower for word in browse_words):
+                return self.fetch_and_read_results(query, search)
+            elif BROWSE_CHOICE_RE.search(response_lower):
                 print("🌐 User chose: open browser")
+                if search:
+                    search.cancel()
                 return self.open_browser_search(query)
             else:
                 # Default to reading if unclear
                 print("❓ Unclear response - defaulting to read results")
-                return self.fetch_and_read_results(query)
+                return self.fetch_and_read_results(query, search)
         else:
             print("❌ No response - defaulting to read results")
-            return self.fetch_and_read_results(query)
-
-    def fetch_and_read_results(self, query):
+            return self.fetch_and_read_results(query, search)
+
+    def start_search(self, query):
+        """Start a DuckDuckGo instant answer request in the background (needs permission first)"""
+        if self.cached_search(query) is not None:
+            return None  # Answered recently, nothing to fetch
+
+        # Use DuckDuckGo instant answers API (privacy-focused)
+        encoded_query = urllib.parse.quote_plus(query)
+        search_url = f"https://api.duckduckgo.com/?q={encoded_query}&format=json&no_html=1&skip_disambig=1"
+        # Fail fast (connect, read) so a stalled API falls back to the browser quickly
+        return self.io_pool.submit(self.http.get, search_url, timeout=(1.5, 3.0))
+
+    def cached_search(self, query):
+        """Instant answer data for a recently searched query, or None"""
+        cached = self.search_cache.get(query)
+        if cached and time.monotonic() - cached[0] < self.search_cache_ttl:
+            return cached[1]
+        return None
+
+    def fetch_and_read_results(self, query, search=None):
         """Fetch web search results and read them aloud"""
         try:
             print(f"🔍 Searching for: {query}")
-            self.speak("Let me search for that", allow_interruption=False)
-
-            # Use DuckDuckGo instant answers API (privacy-focused)
-            encoded_query = urllib.parse.quote_plus(query)
-            search_url = f"https://api.duckduckgo.com/?q={encoded_query}&format=json&no_html=1&skip_disambig=1"
-
-            response = requests.get(search_url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
+            data = self.cached_search(query)
+            if data is not None:
+                print("⚡ Using recent search result")
+            else:
+                if search is None:
+                    search = self.start_search(query)
 
+                # The request runs while we speak
+                self.speak("Let me search for that", allow_interruption=False, cache=True)
+                response = search.result()
+                if response.status_code == 200:
+                    data = json_loads(response.content)
+                    # Drop expired answers so the cache can't grow over a long session
+                    now = time.monotonic()
+                    self.search_cache = {q: entry for q, entry in self.search_cache.items()
+                                         if now - entry[0] < self.search_cache_ttl}
+                    self.search_cache[query] = (now, data)
+
+            if data is not None:
                 # Try to get a direct answer
                 answer = data.get('AbstractText', '').strip()
                 if not answer:
@@ -1005,7 +1710,7 @@ class VoiceAssistant:
 
                 if answer:
                     # Clean up the answer for speech
-                    clean_answer = answer.replace('\n', ' ').replace('  ', ' ')
+                    clean_answer = WHITESPACE_RE.sub(' ', answer)
                     # Limit length for speech
                     if len(clean_answer) > 300:
                         clean_answer = clean_answer[:300] + "... would you like me to open a browser for more details?"
@@ -1016,7 +1721,7 @@ class VoiceAssistant:
                     # No direct answer found, offer browser instead
                     print("❓ No direct answer found")
                     fallback_msg = "I couldn't find a direct answer. Let me open a browser search for you."
-                    self.speak(fallback_msg, allow_interruption=False)
+                    self.speak(fallback_msg, allow_interruption=False, cache=True)
                     time.sleep(1)  # Brief pause
                     return self.open_browser_search(query)
             else:
@@ -1026,7 +1731,7 @@ class VoiceAssistant:
         except Exception as e:
             print(f"🔍 Search error: {e}")
             error_msg = "I had trouble searching. Let me open a browser for you instead."
-            self.speak(error_msg, allow_interruption=False)
+            self.speak(error_msg, allow_interruption=False, cache=True)
             time.sleep(1)
             return self.open_browser_search(query)
 
@@ -1034,14 +1739,10 @@ class VoiceAssistant:
         """Open browser with search results"""
         try:
             print("🌐 Opening web browser...")
-            # Use Popen to avoid blocking
+            # The user's default browser; a running browser just gets a new tab
             encoded_query = urllib.parse.quote_plus(query)
-            subprocess.Popen(['firefox', f'https://duckduckgo.com/?q={encoded_query}'],
-                             stdout=subprocess.DEVNULL,
-                             stderr=subprocess.DEVNULL)
-
-            # Give the browser time to start
-            time.sleep(2)
+            if not webbrowser.open(f'https://duckduckgo.com/?q={encoded_query}', new=2):
+                return "Could not open web browser"
 
             return f"Opened browser search for {query}"
         except Exception as e:
@@ -1052,25 +1753,28 @@ class VoiceAssistant:
         """Send query to local AI with explicit local-only instruction"""
         try:
             messages = [
-                {"role": "system",
-                 "content": "You are a local AI assistant. Answer questions using only your training data. If a question requires current information, real-time data, or internet searches, respond with exactly: 'I need online resources to answer that properly.'"},
+                LOCAL_ONLY_SYSTEM_MESSAGE,
                 {"role": "user", "content": f"Please provide a brief, spoken response to: {text}"}
             ]
             
-            ai_response = self.query_backend(messages, temperature=0.7, 
-                                           max_tokens=self.profile_settings.get('response_tokens', 1000))
-            
-            if ai_response:
+            response = StreamedResponse(self.stream_sentences(self.stream_backend(
+                messages, temperature=0.7, max_tokens=self.profile_settings.get('response_tokens', 1000))))
+
+            # The local-only refusal is a single sentence, so the first one decides
+            first_sentence = response.peek()
+            if first_sentence:
                 # Check if AI indicates it needs online resources
-                if "I need online resources" in ai_response:
+                if "I need online resources" in first_sentence:
+                    response.close()
                     if not self.request_online_permission("AI research with online context"):
                         return "Okay, I'll stick to what I know locally. Is there anything else I can help you with from my local knowledge?"
 
                     # Permission granted - send query without local-only restriction
                     return self.query_ai_unrestricted(text)
 
-                return ai_response
+                return response
             else:
+                response.close()
                 return "Sorry, I couldn't process that request"
 
         except Exception as e:
@@ -1084,12 +1788,13 @@ class VoiceAssistant:
                 {"role": "user", "content": f"Please provide a brief, spoken response to: {text}"}
             ]
             
-            ai_response = self.query_backend(messages, temperature=0.7, 
-                                           max_tokens=self.profile_settings.get('response_tokens', 1000))
-            
-            if ai_response:
-                return ai_response
+            response = StreamedResponse(self.stream_sentences(self.stream_backend(
+                messages, temperature=0.7, max_tokens=self.profile_settings.get('response_tokens', 1000))))
+
+            if response.peek():
+                return response
             else:
+                response.close()
                 return "Sorry, I couldn't process that request"
 
         except Exception as e:
@@ -1106,44 +1811,52 @@ class VoiceAssistant:
     def handle_conversational_response(self, text):
         """Handle responses during conversational mode with full context"""
         try:
-            # Build messages with conversation history
-            messages = [
-                {"role": "system",
-                 "content": "You are having a friendly conversation. Respond naturally and keep the conversation flowing. Feel free to ask follow-up questions or share related thoughts. Be engaging and personable."}
-            ]
-            
             # Dynamic context management based on profile settings
             max_context_tokens = self.profile_settings.get('context_tokens', 16000)
-            system_tokens = self.estimate_tokens(messages[0]['content'])
+            system_message = CONVERSATION_SYSTEM_MESSAGE
+            if self.working_context:
+                # Earlier details the user shared that are no longer in the history window
+                system_message = {
+                    "role": "system",
+                    "content": (f"{CONVERSATION_SYSTEM_MESSAGE['content']} "
+                                f"Earlier in this conversation the user said: {'; '.join(self.working_context)}.")
+                }
+            system_tokens = self.estimate_tokens(system_message['content'])
             current_tokens = system_tokens + self.estimate_tokens(text)
-            
-            # Add conversation history, newest first, until we approach token limit
-            for i in range(len(self.conversation_history) - 1, -1, -1):
-                msg = self.conversation_history[i]
-                msg_tokens = self.estimate_tokens(msg['content'])
-                
+
+            # Count how much recent history fits, newest first, before approaching the token limit
+            history = self.conversation_history
+            included = 0
+            for msg_tokens in reversed(self.history_tokens):
                 if current_tokens + msg_tokens > max_context_tokens - 2000:  # Leave room for response
-                    print(f"💭 Context limit reached: including {len(self.conversation_history) - i} most recent messages")
+                    print(f"💭 Context limit reached: including {included} most recent messages")
                     break
-                    
-                messages.insert(1, msg)  # Insert after system message
+
                 current_tokens += msg_tokens
-            
-            # Add the current user message
-            messages.append({"role": "user", "content": text})
-            
-            print(f"📊 Context: {current_tokens} tokens, {len(messages)-1} messages from history")
-            
-            ai_response = self.query_backend(messages, temperature=0.8, 
-                                           max_tokens=self.profile_settings.get('response_tokens', 1000))
-            
-            if ai_response:
-                # Update conversation history
-                self.conversation_history.append({"role": "user", "content": text})
-                self.conversation_history.append({"role": "assistant", "content": ai_response})
-                
-                return ai_response
+                included += 1
+
+            # System prompt, the most recent history window, then the current user message
+            messages = [system_message,
+                        *islice(history, len(history) - included, None),
+                        {"role": "user", "content": text}]
+
+            print(f"📊 Context: {current_tokens} tokens, {included} messages from history")
+
+            def update_history(ai_response):
+                # Update conversation history once the response has been spoken
+                self.add_to_history(text, ai_response)
+
+            response = StreamedResponse(
+                self.stream_sentences(self.stream_backend(
+                    messages, temperature=0.8, max_tokens=self.profile_settings.get('response_tokens', 1000))),
+                on_complete=update_history
+            )
+
+            if response.peek():
+                return response
             else:
+                response.on_complete = None
+                response.close()
                 return "Sorry, I couldn't process that response"
 
         except Exception as e:
@@ -1152,34 +1865,31 @@ class VoiceAssistant:
 
     def route_query(self, text):
         """Route query to appropriate handler"""
-        text_lower = text.lower().strip()
+        # Normalized once and shared by every check below; classification is
+        # cached, so repeated phrases are routed without rescanning
+        text_lower = ' '.join(text.casefold().split())
+        route, argument = classify_query(text_lower, self.shutdown_phrase)
+
+        # Unit conversions
+        if route == "conversion":
+            conversion_result = self.handle_conversion(text_lower)
+            if conversion_result:
+                return "local", conversion_result
+            # Not a conversion we can do locally
+            route, argument = classify_query(text_lower, self.shutdown_phrase, conversions=False)
 
-        # Check for shutdown command
-        if self.shutdown_phrase in text_lower:
+        if route == "shutdown":
             return "shutdown", "Okay, bye!"
 
-        # Check for new conversation command
-        if any(phrase in text_lower for phrase in ['new conversation', 'start over', 'clear history', 'fresh start']):
-            self.conversation_history = []
+        if route == "new_conversation":
+            self.clear_history()
             print("🧹 Cleared conversation history (user requested)")
             return "local", "Starting fresh. What would you like to talk about?"
 
-        # Profile management commands - support various phrasings
-        profile_triggers = [
-            ('switch to', 'mode'), ('switched to', 'mode'), ('change to', 'mode'),
-            ('use', 'mode'), ('set', 'mode'), ('enable', 'mode'),
-            ('switch to', 'profile'), ('switched to', 'profile'), ('change to', 'profile'),
-            ('use', 'profile'), ('set', 'profile'), ('enable', 'profile')
-        ]
-        
-        for trigger, keyword in profile_triggers:
-            if trigger in text_lower and keyword in text_lower:
-                # Extract profile name after the trigger word
-                profile_words = text_lower.split(trigger)[-1].strip()
-                profile_words = profile_words.replace('mode', '').replace('profile', '').strip()
-                return "local", self.switch_profile(profile_words)
+        if route == "switch_profile":
+            return "local", self.switch_profile(argument)
         
-        if 'what profile' in text_lower or 'which profile' in text_lower or 'current profile' in text_lower:
+        if route == "current_profile":
             mem_status = self.get_memory_status()
             response = (f"I'm running in {self.profile_settings['name']} mode, "
                        f"using {mem_status['used']/1024:.1f} gigabytes of {mem_status['total']/1024:.1f} available. "
@@ -1187,12 +1897,12 @@ class VoiceAssistant:
                        f"and record up to {self.profile_settings['recording_conversational']//60} minutes.")
             return "local", response
         
-        if 'what profiles' in text_lower or 'available profiles' in text_lower or 'list profiles' in text_lower:
+        if route == "list_profiles":
             response = "I have three profiles: Minimal for gaming or low resources, Standard for everyday use, and Performance for extended conversations. "
             response += f"You're currently using {self.profile_settings['name']} mode."
             return "local", response
         
-        if 'memory' in text_lower and ('using' in text_lower or 'usage' in text_lower or 'status' in text_lower):
+        if route == "memory":
             mem_status = self.get_memory_status()
             response = f"I'm using {mem_status['used']/1024:.1f} gigabytes of {mem_status['total']/1024:.1f} available, "
             response += f"that's {mem_status['percent']:.0f} percent. "
@@ -1200,159 +1910,198 @@ class VoiceAssistant:
                 response += "Memory usage is high, you might want to switch to minimal mode."
             return "local", response
 
-        # Time queries
-        if any(word in text_lower for word in ['time', 'clock', "what time"]):
+        if route == "time":
             return "local", self.get_time()
 
-        # Date queries
-        if any(word in text_lower for word in ['date', 'today', "what day"]):
+        if route == "date":
             return "local", self.get_date()
 
-        # Unit conversions
-        if 'convert' in text_lower or any(unit in text_lower for unit in [
-            'celsius', 'fahrenheit', 'meters', 'feet', 'pounds', 'kilograms'
-        ]):
-            conversion_result = self.handle_conversion(text)
-            if conversion_result:
-                return "local", conversion_result
-
-        # Web search
-        if text_lower.startswith('search') or 'look up' in text_lower:
-            query = text_lower.replace('search', '').replace('look up', '').strip()
-            return "local", self.web_search(query)
+        if route == "search":
+            return "local", self.web_search(argument)
 
         # Send to AI for complex queries (local-first with permission model)
         return "ai", self.query_ai_local_only(text)
 
-    def record_command(self, duration=5, conversational=False):
-        """Record audio command until pause detected"""
+    def record_and_transcribe(self, duration=5, conversational=False):
+        """Record a spoken command until a pause and return its text (None if nothing was recorded)"""
         try:
             if conversational:
                 print(f"💬 Listening for your response...")
             else:
                 print(f"🎤 Recording until pause detected...")
 
-            stream = self.audio.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.chunk_size
-            )
-
-            frames = []
-            recognizer = vosk.KaldiRecognizer(self.vosk_model, self.sample_rate)
-            
-            # Voice activity detection parameters
-            silence_threshold = 1.5  # seconds of silence before stopping
-            
-            # Use profile-based limits
-            if conversational:
-                max_duration = self.profile_settings.get('recording_conversational', 300)
-                initial_wait = 0.3  # Wait briefly for user to start speaking
-                time.sleep(initial_wait)
-            else:
-                max_duration = self.profile_settings.get('recording_command', 60)
-            
-            last_speech_time = time.time()
-            start_time = time.time()
-            has_speech = False
-            
-            last_feedback_time = start_time
-            
-            while True:
-                current_time = time.time()
-                elapsed = current_time - start_time
-                
-                # Provide periodic feedback for long recordings
-                if elapsed > 30 and (current_time - last_feedback_time) > 30:
-                    minutes = int(elapsed / 60)
-                    seconds = int(elapsed % 60)
-                    print(f"⏱️ Recording: {minutes}:{seconds:02d} elapsed...")
-                    last_feedback_time = current_time
-                
-                # Check for maximum duration
-                if elapsed > max_duration:
-                    print(f"⏱️ Maximum recording duration reached ({int(max_duration/60)} minutes)")
-                    break
-                
-                # Read audio chunk
-                data = stream.read(self.chunk_size, exception_on_overflow=False)
-                frames.append(data)
-                
-                # Check for speech using Vosk's partial recognition
-                if recognizer.AcceptWaveform(data):
-                    result = json.loads(recognizer.Result())
-                    if result.get('text'):
-                        # Speech detected
-                        last_speech_time = current_time
-                        has_speech = True
+            with self.input_stream() as audio_queue:
+                # The recognizer that detects the pause also produces the transcript;
+                # raw audio is only kept when Whisper will re-transcribe it
+                recording = bytearray()
+                texts = []
+                received = False
+                recognizer = self.stt_recognizer
+                recognizer.Reset()
+
+                # Voice activity detection parameters
+                silence_threshold = self.vad_silence_threshold if self.vad else self.silence_threshold
+                # With Whisper transcribing and the VAD finding the pause, Vosk has nothing to do
+                decode = not (self.whisper_model and self.vad)
+
+                # Use profile-based limits
+                if conversational:
+                    max_duration = self.profile_settings.get('recording_conversational', 300)
+                    initial_wait = 0.3  # Wait briefly for user to start speaking
+                    time.sleep(initial_wait)
                 else:
-                    # Check partial result for ongoing speech
-                    partial = json.loads(recognizer.PartialResult())
-                    if partial.get('partial'):
-                        # Ongoing speech detected
-                        last_speech_time = current_time
-                        has_speech = True
-                
-                # Check for silence after speech
-                if has_speech and (current_time - last_speech_time) > silence_threshold:
-                    duration = current_time - start_time
-                    if duration < 60:
-                        print(f"🔇 Pause detected after {duration:.1f} seconds")
-                    else:
-                        minutes = int(duration / 60)
-                        seconds = int(duration % 60)
-                        print(f"🔇 Pause detected after {minutes}:{seconds:02d}")
-                    break
+                    max_duration = self.profile_settings.get('recording_command', 60)
 
-            stream.close()
-            
-            # Return recorded audio
-            if frames:
-                return b''.join(frames)
-            else:
+                last_speech_time = time.time()
+                start_time = time.time()
+                has_speech = False
+                last_partial = ""
+                # Audio heard just before the VAD triggers, so the first word isn't clipped
+                preroll = deque(maxlen=3)
+                # Chunks waiting to be decoded together
+                pending = []
+
+                last_feedback_time = start_time
+
+                while True:
+                    current_time = time.time()
+                    elapsed = current_time - start_time
+
+                    # Provide periodic feedback for long recordings
+                    if elapsed > 30 and (current_time - last_feedback_time) > 30:
+                        minutes = int(elapsed / 60)
+                        seconds = int(elapsed % 60)
+                        print(f"⏱️ Recording: {minutes}:{seconds:02d} elapsed...")
+                        last_feedback_time = current_time
+
+                    # Check for maximum duration
+                    if elapsed > max_duration:
+                        print(f"⏱️ Maximum recording duration reached ({int(max_duration/60)} minutes)")
+                        break
+
+                    if not self.is_listening:
+                        # Shutdown requested
+                        break
+
+                    # Wait for the next audio chunk from the stream callback
+                    try:
+                        data = audio_queue.get(timeout=1)
+                    except queue.Empty:
+                        print("⚠️ Microphone stopped delivering audio")
+                        break
+                    received = True
+                    if self.whisper_model:
+                        recording += data
+
+                    if self.vad:
+                        if self.is_speech(data):
+                            last_speech_time = current_time
+                            if not has_speech:
+                                has_speech = True
+                                if decode:
+                                    pending.extend(preroll)
+                        if not has_speech:
+                            # Leave the recognizer idle until the user starts talking
+                            preroll.append(data)
+                            continue
+
+                    # Decode several chunks per call to cut Python/C transitions
+                    if decode:
+                        pending.append(data)
+                    if len(pending) >= self.decode_batch_chunks:
+                        if recognizer.AcceptWaveform(b''.join(pending)):
+                            result = json_loads(recognizer.Result())
+                            last_partial = ""
+                            if result.get('text'):
+                                # Speech detected
+                                texts.append(result['text'])
+                                if not self.vad:
+                                    last_speech_time = current_time
+                                    has_speech = True
+                        elif not self.vad:
+                            # Check for speech using Vosk's partial recognition.
+                            # The partial hypothesis stays populated through trailing
+                            # silence until Vosk finalizes, so only count it as speech
+                            # while it is still changing
+                            partial = json_loads(recognizer.PartialResult()).get('partial', '')
+                            if partial and partial != last_partial:
+                                # Ongoing speech detected
+                                last_speech_time = current_time
+                                has_speech = True
+                            last_partial = partial
+                        pending.clear()
+
+                    # Check for silence after speech
+                    if has_speech and (current_time - last_speech_time) > silence_threshold:
+                        duration = current_time - start_time
+                        if duration < 60:
+                            print(f"🔇 Pause detected after {duration:.1f} seconds")
+                        else:
+                            minutes = int(duration / 60)
+                            seconds = int(duration % 60)
+                            print(f"🔇 Pause detected after {minutes}:{seconds:02d}")
+                        break
+
+                if not self.whisper_model:
+                    # Whisper transcribes the recording itself and needs no final Vosk pass
+                    if pending:
+                        recognizer.AcceptWaveform(b''.join(pending))
+                    final_text = json_loads(recognizer.FinalResult()).get('text')
+                    if final_text:
+                        texts.append(final_text)
+
+            if not received:
                 return None
 
+            if recording:
+                return self.speech_to_text(recording)
+
+            return ' '.join(text for text in texts if text).strip()
+
         except Exception as e:
             print(f"Recording error: {e}")
             return None
 
+    def speech_to_text_whisper(self, audio_data):
+        """Convert audio data to text using faster-whisper"""
+        samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+        segments, _ = self.whisper_model.transcribe(
+            samples,
+            language="en",
+            beam_size=1,
+            vad_filter=True
+        )
+        # Match Vosk's lowercase, unpunctuated output so command matching is unchanged
+        text = ' '.join(segment.text for segment in segments).lower()
+        return ' '.join(re.sub(r"[^\w\s']", ' ', text).split())
+
     def speech_to_text(self, audio_data):
         """Convert audio data to text using Vosk"""
+        if self.whisper_model:
+            try:
+                return self.speech_to_text_whisper(audio_data)
+            except Exception as e:
+                print(f"Whisper transcription error, falling back to Vosk: {e}")
+
         try:
-            # Save audio to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_file:
-                temp_filename = temp_file.name
-
-            with wave.open(temp_filename, 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(self.audio.get_sample_size(self.format))
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(audio_data)
-
-            # Transcribe with Vosk
-            recognizer = vosk.KaldiRecognizer(self.vosk_model, self.sample_rate)
+            # Transcribe straight from memory in chunk-sized slices
+            recognizer = self.stt_recognizer
+            recognizer.Reset()
             results = []
 
-            with wave.open(temp_filename, 'rb') as wf:
-                while True:
-                    data = wf.readframes(self.chunk_size)
-                    if len(data) == 0:
-                        break
-                    if recognizer.AcceptWaveform(data):
-                        result = json.loads(recognizer.Result())
-                        if result.get('text'):
-                            results.append(result['text'])
+            audio = memoryview(audio_data)
+            step = self.chunk_size * 2  # 16-bit samples
+            for offset in range(0, len(audio), step):
+                if recognizer.AcceptWaveform(bytes(audio[offset:offset + step])):
+                    result = json_loads(recognizer.Result())
+                    if result.get('text'):
+                        results.append(result['text'])
 
             # Get final result
-            final_result = json.loads(recognizer.FinalResult())
+            final_result = json_loads(recognizer.FinalResult())
             if final_result.get('text'):
                 results.append(final_result['text'])
 
-            # Cleanup
-            Path(temp_filename).unlink(missing_ok=True)
-
             return ' '.join(results).strip()
 
         except Exception as e:
@@ -1366,60 +2115,60 @@ class VoiceAssistant:
 
         while self.is_listening and retry_count < max_retries:
             try:
-                recognizer = vosk.KaldiRecognizer(self.vosk_model, self.sample_rate)
-
-                # Try to open audio stream with retry logic
-                stream = None
-                for attempt in range(3):
-                    try:
-                        stream = self.audio.open(
-                            format=self.format,
-                            channels=self.channels,
-                            rate=self.sample_rate,
-                            input=True,
-                            frames_per_buffer=self.chunk_size
-                        )
-                        break
-                    except Exception as e:
-                        print(f"Audio stream attempt {attempt + 1} failed: {e}")
-                        time.sleep(1)  # Wait before retry
-
-                if not stream:
-                    print("❌ Could not open audio stream")
-                    return False
-
-                print(f"👂 Listening for wake word '{self.wake_word}'...")
-                retry_count = 0  # Reset retry count on successful stream open
-
-                while self.is_listening:
-                    try:
-                        data = stream.read(self.chunk_size, exception_on_overflow=False)
-
-                        if recognizer.AcceptWaveform(data):
-                            result = json.loads(recognizer.Result())
-                            if result.get('text'):
-                                transcript = result['text'].lower().strip()
-
-                                # Check for wake word
-                                if self.wake_word in transcript:
-                                    print(f"🎉 Wake word detected: '{transcript}'")
-                                    stream.close()
-                                    return True  # Wake word found
-
-                                # Check for shutdown command
-                                if self.shutdown_phrase in transcript:
-                                    print(f"🛑 Shutdown command detected: '{transcript}'")
-                                    stream.close()
+                recognizer = self.wake_recognizer
+                recognizer.Reset()
+
+                with self.input_stream() as audio_queue:
+                    print(f"👂 Listening for wake word '{self.wake_word}'...")
+                    retry_count = 0  # Reset retry count once audio is flowing
+
+                    # Quiet room audio skips Vosk entirely; the last moment of it is
+                    # kept so a soft start of the wake word isn't lost
+                    hangover_chunks = max(1, int(self.speech_hangover * self.sample_rate / self.stream_chunk_size))
+                    quiet_chunks = hangover_chunks
+                    preroll = deque(maxlen=max(1, int(self.wake_preroll * self.sample_rate / self.stream_chunk_size)))
+
+                    while self.is_listening:
+                        try:
+                            data = audio_queue.get(timeout=1)
+
+                            if self.is_loud(data):
+                                if quiet_chunks > hangover_chunks:
+                                    for buffered in preroll:
+                                        recognizer.AcceptWaveform(buffered)
+                                    preroll.clear()
+                                quiet_chunks = 0
+                            else:
+                                quiet_chunks += 1
+                                if quiet_chunks > hangover_chunks:
+                                    preroll.append(data)
+                                    continue
+
+                            # Vosk output is already lowercase, so match on the raw
+                            # JSON and only parse it when something was heard
+                            if recognizer.AcceptWaveform(data):
+                                raw = recognizer.Result()
+
+                                # Check for shutdown command (final results only)
+                                if self.shutdown_phrase in raw:
+                                    print(f"🛑 Shutdown command detected: '{json_loads(raw).get('text', '')}'")
                                     return "shutdown"
+                            else:
+                                # Partials let us react before Vosk finalizes the utterance
+                                raw = recognizer.PartialResult()
 
-                    except Exception as e:
-                        if self.is_listening:
-                            print(f"⚠️ Audio read error: {e}")
-                            # Break inner loop to retry stream setup
-                            break
+                            # Check for wake word
+                            if self.wake_word in raw:
+                                result = json_loads(raw)
+                                print(f"🎉 Wake word detected: '{result.get('text') or result.get('partial', '')}'")
+                                return True  # Wake word found
+
+                        except Exception as e:
+                            if self.is_listening:
+                                print(f"⚠️ Audio read error: {e}")
+                                # Leave the loop so the caller can restart listening
+                                break
 
-                if stream:
-                    stream.close()
                 return False
 
             except Exception as e:
@@ -1438,120 +2187,96 @@ class VoiceAssistant:
         """Handle complete voice interaction after wake word"""
         try:
             self.is_processing = True
-            self.conversational_mode = False  # Reset at start of new interaction
-            
-            # Check if we should clear conversation history (after timeout or explicit new conversation)
-            # Clear history if it's been more than 5 minutes since last interaction
-            if hasattr(self, 'last_interaction_time'):
-                if time.time() - self.last_interaction_time > 300:  # 5 minutes
-                    self.conversation_history = []
-                    print("🧹 Cleared conversation history (timeout)")
-            
-            self.last_interaction_time = time.time()
-            
-            self.speak("Yes?", allow_interruption=False)  # Short acknowledgment
 
-            # Record the user's command
-            audio_data = self.record_command()
-            if not audio_data:
-                self.speak("I didn't hear anything", allow_interruption=False)
-                return
+            # Each pass handles one command; an interrupted response starts the next
+            # pass instead of recursing, so long sessions don't grow the stack
+            while self.is_listening:
+                self.conversational_mode = False  # Reset at start of new interaction
 
-            # Convert speech to text
-            command_text = self.speech_to_text(audio_data)
-            if not command_text:
-                self.speak("I couldn't understand that", allow_interruption=False)
-                return
+                # Check if we should clear conversation history (after timeout or explicit new conversation)
+                # Clear history if it's been more than 5 minutes since last interaction
+                if hasattr(self, 'last_interaction_time'):
+                    if time.time() - self.last_interaction_time > 300:  # 5 minutes
+                        self.clear_history()
+                        print("🧹 Cleared conversation history (timeout)")
 
-            print(f"📝 Command: '{command_text}'")
+                self.last_interaction_time = time.time()
 
-            # Route and process the command
-            route_type, response = self.route_query(command_text)
+                self.speak("Yes?", allow_interruption=False, cache=True)  # Short acknowledgment
 
-            if route_type == "shutdown":
-                self.speak(response, allow_interruption=False)
-                self.shutdown()
-                return
+                # Record and transcribe the user's command
+                command_text = self.record_and_transcribe()
+                if not self.is_listening:
+                    return
 
-            # Store initial exchange in conversation history
-            if route_type == "ai":
-                self.conversation_history.append({"role": "user", "content": command_text})
-                self.conversation_history.append({"role": "assistant", "content": response})
+                if command_text is None:
+                    self.speak("I didn't hear anything", allow_interruption=False, cache=True)
+                    return
 
-            # Speak the response with interruption capability for long responses
-            was_interrupted = self.speak(response, allow_interruption=True)
+                if not command_text:
+                    self.speak("I couldn't understand that", allow_interruption=False, cache=True)
+                    return
+
+                print(f"📝 Command: '{command_text}'")
+
+                # Route and process the command
+                route_type, response = self.route_query(command_text)
+
+                if route_type == "shutdown":
+                    self.speak(response, allow_interruption=False, cache=True)
+                    self.is_listening = False
+                    return
+
+                # Speak the response with interruption capability for long responses
+                was_interrupted = self.speak(response, allow_interruption=True)
+                response = str(response)  # Text actually spoken, for streamed AI responses
+
+                # Store initial exchange in conversation history
+                if route_type == "ai":
+                    self.add_to_history(command_text, response)
+
+                if not self.is_listening:
+                    return
+
+                if was_interrupted:
+                    # Speech was interrupted by "ziggy" - handle the new command
+                    print("🔄 Response was interrupted - processing new command")
+                    continue
 
-            if was_interrupted:
-                print("🔄 Response was interrupted - processing new command")
-                # Speech was interrupted by "ziggy" - handle the new command
-                self.handle_voice_command()
-                return
-            else:
                 print(f"✅ Response delivered completely")
 
-            # Check if the response contains a question
-            if self.contains_question(response):
-                print("❓ Response contains a question - entering conversational mode")
-                self.conversational_mode = True
-                
-                # Listen for the answer
-                answer_audio = self.record_command(conversational=True)
-                if answer_audio:
-                    answer_text = self.speech_to_text(answer_audio)
-                    if answer_text:
-                        print(f"📝 User answered: '{answer_text}'")
-                        
-                        # Check for shutdown in conversation
-                        if self.shutdown_phrase in answer_text.lower():
-                            self.speak("Okay, bye!", allow_interruption=False)
-                            self.shutdown()
-                            return
-                        
-                        # Process the answer as a conversational follow-up - NOT through route_query!
-                        follow_up_response = self.handle_conversational_response(answer_text)
-                        
-                        # Speak the follow-up response and check if it contains another question
-                        was_interrupted = self.speak(follow_up_response, allow_interruption=True)
-                        
-                        if not was_interrupted and self.contains_question(follow_up_response):
-                            # Continue the conversation if AI asks another question
-                            print("🔄 Continuing conversation...")
-                            # Don't reset everything - just continue listening
-                            continue_conversation = True
-                            while continue_conversation:
-                                answer_audio = self.record_command(conversational=True)
-                                if answer_audio:
-                                    answer_text = self.speech_to_text(answer_audio)
-                                    if answer_text:
-                                        print(f"📝 User answered: '{answer_text}'")
-                                        
-                                        # Check for shutdown
-                                        if self.shutdown_phrase in answer_text.lower():
-                                            self.speak("Okay, bye!", allow_interruption=False)
-                                            self.shutdown()
-                                            return
-                                        
-                                        # Continue the conversation
-                                        follow_up_response = self.handle_conversational_response(answer_text)
-                                        was_interrupted = self.speak(follow_up_response, allow_interruption=True)
-                                        
-                                        # Check if we should continue
-                                        if was_interrupted or not self.contains_question(follow_up_response):
-                                            continue_conversation = False
-                                else:
-                                    continue_conversation = False
-
-            # Add a small pause to ensure audio operations complete
-            time.sleep(0.5)
-
-            # For web operations, add extra recovery time
-            if 'browser' in response.lower() or 'search' in response.lower():
-                print("🔄 Allowing extra time for browser operations...")
-                time.sleep(1.5)
+                # Keep listening for answers while the assistant ends on a question
+                while self.contains_question(response):
+                    if self.conversational_mode:
+                        print("🔄 Continuing conversation...")
+                    else:
+                        print("❓ Response contains a question - entering conversational mode")
+                        self.conversational_mode = True
+
+                    answer_text = self.record_and_transcribe(conversational=True)
+                    if not answer_text or not self.is_listening:
+                        break
+
+                    print(f"📝 User answered: '{answer_text}'")
+
+                    # Check for shutdown in conversation
+                    if self.shutdown_phrase in answer_text.lower():
+                        self.speak("Okay, bye!", allow_interruption=False, cache=True)
+                        self.is_listening = False
+                        return
+
+                    # Process the answer as a conversational follow-up - NOT through route_query!
+                    response = self.handle_conversational_response(answer_text)
+                    was_interrupted = self.speak(response, allow_interruption=True)
+                    response = str(response)
+                    if was_interrupted or not self.is_listening:
+                        break
+
+                break
 
         except Exception as e:
             print(f"Command handling error: {e}")
-            self.speak("Sorry, I had trouble processing that", allow_interruption=False)
+            self.speak("Sorry, I had trouble processing that", allow_interruption=False, cache=True)
         finally:
             self.is_processing = False
             self.conversational_mode = False  # Reset conversational mode
@@ -1564,8 +2289,19 @@ class VoiceAssistant:
         print(f"🤖 {welcome_msg}")
         self.speak(welcome_msg, allow_interruption=False)
 
+    def request_shutdown(self, signum=None, frame=None):
+        """Signal handler: stop listening and end any response being spoken; run() does the teardown"""
+        # A second Ctrl-C or SIGTERM kills the process outright, in case the
+        # graceful path is stuck (a stalled read, the keep-backend prompt...)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        self.is_listening = False
+        stop_event = self.speaking_stop_event
+        if stop_event:
+            stop_event.set()
+
     def shutdown(self):
-        """Gracefully shutdown the voice assistant"""
+        """Gracefully shutdown the voice assistant (called by run() once its loops have ended)"""
         print("🛑 Shutting down Ziggy...")
         self.is_listening = False
         
@@ -1577,12 +2313,12 @@ class VoiceAssistant:
             
             # Record response
             audio_data = self.record_backend_choice()
-            if audio_data:
+            if audio_data is not None:
                 response_text = self.speech_to_text(audio_data)
-                response_lower = response_text.lower().strip()
+                response_lower = response_text.casefold()
                 
                 # Check for affirmative
-                if any(word in response_lower for word in ['yes', 'yeah', 'yep', 'keep', 'leave']):
+                if KEEP_RUNNING_RE.search(response_lower):
                     print(f"✅ Leaving {self.backend_name} running")
                 else:
                     print(f"🛑 Stopping {self.backend_name}...")
@@ -1596,10 +2332,16 @@ class VoiceAssistant:
                 # No response - default to leaving it running
                 print(f"✅ Leaving {self.backend_name} running (no response)")
         
+        self.stop_piper()
+        self.interrupt_playback()
+
+        self.io_pool.shutdown(wait=False)
+        self.http.close()
+        if self.mic_stream:
+            self.mic_stream.close()
         if self.audio:
             self.audio.terminate()
         print("👋 Goodbye!")
-        sys.exit(0)
 
     def run(self):
         """Main run loop for the voice assistant"""
@@ -1607,9 +2349,11 @@ class VoiceAssistant:
             print("❌ Setup failed - cannot start voice assistant")
             return
 
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, lambda s, f: self.shutdown())
-        signal.signal(signal.SIGTERM, lambda s, f: self.shutdown())
+        # Setup signal handlers for graceful shutdown. The handlers only raise the
+        # shutdown flag: the mic may be held by another thread at that moment, so
+        # the interactive part of shutdown waits until the loops below have ended
+        signal.signal(signal.SIGINT, self.request_shutdown)
+        signal.signal(signal.SIGTERM, self.request_shutdown)
 
         # Play startup message
         self.startup_message()
@@ -1626,8 +2370,8 @@ class VoiceAssistant:
                 wake_result = self.listen_for_wake_word()
 
                 if wake_result == "shutdown":
-                    self.speak("Okay, bye!", allow_interruption=False)
-                    self.shutdown()
+                    self.speak("Okay, bye!", allow_interruption=False, cache=True)
+                    break
                 elif wake_result == True:
                     # Wake word detected - handle command
                     self.handle_voice_command()
@@ -1640,10 +2384,11 @@ class VoiceAssistant:
                     time.sleep(0.1)
 
         except KeyboardInterrupt:
-            self.shutdown()
+            pass
         except Exception as e:
             print(f"Main loop error: {e}")
-            self.shutdown()
+
+        self.shutdown()
 
 
 def main():